@@ -7,3 +7,14 @@ class Role(StrEnum):
     SEER = "SEER"
     WITCH = "WITCH"
     HUNTER = "HUNTER"
+
+
+ROLE_CODES: dict[Role, str] = {role: role.value for role in Role}
+SPECIAL_ROLES = frozenset({Role.SEER, Role.WITCH, Role.HUNTER})
+TARGETED_INPUT_ACTION_TYPES = frozenset({
+    "VOTE",
+    "WOLF_KILL",
+    "SEER_CHECK",
+    "HUNTER_SHOOT",
+    "WITCH_POISON",
+})
@@ -1,8 +1,11 @@
+from bisect import insort
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 import re
 from typing import Literal
 
+from app.domain.enums import Role
 from app.domain.player import AIPlayer, Player
 
 PublicMessageListener = Callable[[str], None]
@@ -25,6 +28,21 @@ ATTACK_WORDS = (
 )
 SUPPORT_WORDS = ("保", "认好", "金水", "好人", "站边", "相信", "信你", "捞")
 MENTION_BOUNDARIES = "，。；！？,.!?;：:"
+_SPEECH_PREFIX_PATTERN = re.compile(r"([1-9]\d*)号发言：")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_ATTACK_WORD_SET = frozenset(ATTACK_WORDS)
+_SUPPORT_WORD_SET = frozenset(SUPPORT_WORDS)
+# Zero-width lookahead reports every start position, so overlapping words such
+# as "要出" and "出" are both seen in a single scan. Only the longest word per
+# position is captured, so no stance word may be a prefix of another.
+_MENTION_WORD_PATTERN = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(word)
+            for word in sorted({*ATTACK_WORDS, *SUPPORT_WORDS}, key=len, reverse=True)
+        )
+    )
+)
 
 
 def _classify_mention(message: str, seat_id: int) -> str:
@@ -50,8 +68,9 @@ def _classify_mention(message: str, seat_id: int) -> str:
         mention_window = mention_window[
             max(0, local_marker_index - 12) : local_marker_index + len(marker) + 12
         ]
-    attack_score = sum(word in mention_window for word in ATTACK_WORDS)
-    support_score = sum(word in mention_window for word in SUPPORT_WORDS)
+    found_words = set(_MENTION_WORD_PATTERN.findall(mention_window))
+    attack_score = len(found_words & _ATTACK_WORD_SET)
+    support_score = len(found_words & _SUPPORT_WORD_SET)
     if "不保" in mention_window:
         attack_score += 1
         support_score = max(0, support_score - 1)
@@ -64,7 +83,7 @@ def _classify_mention(message: str, seat_id: int) -> str:
 
 
 def _snippet(message: str, *, limit: int = 80) -> str:
-    compact = re.sub(r"\s+", " ", message).strip()
+    compact = _WHITESPACE_PATTERN.sub(" ", message).strip()
     return compact if len(compact) <= limit else f"{compact[:limit]}..."
 
 
@@ -131,17 +150,40 @@ class GameContext:
     killed_tonight: list[int] = field(default_factory=list)
     night_death_causes: dict[int, set[str]] = field(default_factory=dict)
     private_logs: dict[int, list[str]] = field(default_factory=dict)
-    public_chat_events: list[PublicChatEvent] = field(default_factory=list)
+    public_chat_events: deque[PublicChatEvent] = field(default_factory=deque)
     last_vote_result: VoteSnapshot | None = None
-    vote_history: list[VoteSnapshot] = field(default_factory=list)
-    night_actions: list[NightActionSnapshot] = field(default_factory=list)
+    vote_history: deque[VoteSnapshot] = field(default_factory=deque)
+    night_actions: deque[NightActionSnapshot] = field(default_factory=deque)
     public_message_listeners: list[PublicMessageListener] = field(default_factory=list)
     public_chat_event_listeners: list[PublicChatEventListener] = field(default_factory=list)
     private_message_listeners: list[PrivateMessageListener] = field(default_factory=list)
     private_chat_event_listeners: list[PrivateChatEventListener] = field(default_factory=list)
+    seat_order: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    role_masks: dict[Role, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    public_speech_log: dict[int, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _alive_seats_mask: int = field(default=-1, init=False, repr=False, compare=False)
+    _alive_seats: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for seat_id, player in self.players.items():
+            insort(self.seat_order, seat_id)
+            self.role_masks[player.role] = self.role_masks.get(player.role, 0) | 1 << seat_id
+        for message in self.public_chat_history:
+            self._index_public_speech(message)
 
     def add_player(self, player: Player) -> None:
+        seat_bit = 1 << player.seat_id
+        previous = self.players.get(player.seat_id)
+        if previous is None:
+            insort(self.seat_order, player.seat_id)
+        else:
+            self.role_masks[previous.role] &= ~seat_bit
         self.players[player.seat_id] = player
+        self.role_masks[player.role] = self.role_masks.get(player.role, 0) | seat_bit
         self.private_logs.setdefault(player.seat_id, [])
 
     def add_public_message(
@@ -154,6 +196,7 @@ class GameContext:
         target_seats: list[int] | None = None,
     ) -> None:
         self.public_chat_history.append(message)
+        self._index_public_speech(message)
         for listener in self.public_message_listeners:
             listener(message)
         event = PublicChatEvent(
@@ -196,15 +239,24 @@ class GameContext:
         if isinstance(player, AIPlayer):
             player.remember(message)
 
+    def _index_public_speech(self, message: str) -> None:
+        speech_match = _SPEECH_PREFIX_PATTERN.match(message)
+        if speech_match is not None:
+            self.public_speech_log.setdefault(int(speech_match.group(1)), []).append(message)
+
     def _remember_public_speech_interactions(self, event: PublicChatEvent) -> None:
-        mentioned_seats = _mentioned_seat_ids(event.message)
-        actor = self.players.get(event.actor_seat)
+        message = event.message
+        actor_seat = event.actor_seat
+        relations = {
+            seat_id: _classify_mention(message, seat_id)
+            for seat_id in _mentioned_seat_ids(message)
+            if seat_id != actor_seat
+        }
+        snippet = _snippet(message)
+        actor = self.players.get(actor_seat)
         if isinstance(actor, AIPlayer):
-            actor.remember(f"你公开发言：{_snippet(event.message)}")
-            for mentioned_seat in mentioned_seats:
-                if mentioned_seat == event.actor_seat:
-                    continue
-                relation = _classify_mention(event.message, mentioned_seat)
+            actor.remember(f"你公开发言：{snippet}")
+            for mentioned_seat, relation in relations.items():
                 if relation == "攻击/质疑":
                     actor.adjust_suspicion(mentioned_seat, 2)
                     actor.adjust_trust(mentioned_seat, -1)
@@ -214,18 +266,14 @@ class GameContext:
         for seat_id, player in sorted(self.players.items()):
             if not isinstance(player, AIPlayer):
                 continue
-            if seat_id == event.actor_seat:
+            relation = relations.get(seat_id)
+            if relation is None:
                 continue
-            if seat_id not in mentioned_seats:
-                continue
-            relation = _classify_mention(event.message, seat_id)
-            if relation == "攻击/质疑" and event.actor_seat is not None:
-                player.adjust_suspicion(event.actor_seat, 1)
-            elif relation == "保护/认可" and event.actor_seat is not None:
-                player.adjust_trust(event.actor_seat, 1)
-            player.remember(
-                f"{event.actor_seat}号在公开发言中{relation}你：{_snippet(event.message)}"
-            )
+            if relation == "攻击/质疑" and actor_seat is not None:
+                player.adjust_suspicion(actor_seat, 1)
+            elif relation == "保护/认可" and actor_seat is not None:
+                player.adjust_trust(actor_seat, 1)
+            player.remember(f"{actor_seat}号在公开发言中{relation}你：{snippet}")
 
     def remember_vote_snapshot(self, snapshot: VoteSnapshot) -> None:
         for seat_id, player in sorted(self.players.items()):
@@ -276,11 +324,26 @@ class GameContext:
         self.private_chat_event_listeners.append(listener)
 
     def alive_seat_ids(self) -> list[int]:
-        return [
-            seat_id
-            for seat_id, player in sorted(self.players.items())
-            if player.is_alive
-        ]
+        return list(self.alive_seats())
+
+    def alive_seats(self) -> tuple[int, ...]:
+        mask = self.alive_mask()
+        if mask != self._alive_seats_mask:
+            self._alive_seats_mask = mask
+            self._alive_seats = tuple(
+                seat_id for seat_id in self.seat_order if mask >> seat_id & 1
+            )
+        return self._alive_seats
+
+    def alive_mask(self) -> int:
+        mask = 0
+        for seat_id, player in self.players.items():
+            if player.is_alive:
+                mask |= 1 << seat_id
+        return mask
+
+    def seats_in_mask(self, mask: int) -> list[int]:
+        return [seat_id for seat_id in self.seat_order if mask >> seat_id & 1]
 
     def mark_killed_tonight(self, seat_id: int, *, cause: str) -> None:
         if seat_id not in self.killed_tonight:
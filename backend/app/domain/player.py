@@ -1,18 +1,15 @@
 import asyncio
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from typing import Any
 
 from fastapi import WebSocket
 
-from app.domain.enums import Role
+from app.domain.enums import TARGETED_INPUT_ACTION_TYPES, Role
 
-TARGETED_INPUT_ACTION_TYPES = {
-    "VOTE",
-    "WOLF_KILL",
-    "SEER_CHECK",
-    "HUNTER_SHOOT",
-    "WITCH_POISON",
-}
+
+def _score_rank(item: tuple[int, int]) -> tuple[int, int]:
+    return -item[1], item[0]
 
 
 @dataclass(slots=True, kw_only=True)
@@ -29,14 +26,14 @@ class Player:
 class HumanPlayer(Player):
     ws_connection: WebSocket | None = None
     pending_input: asyncio.Future[dict[str, Any]] | None = None
-    pending_action_types: set[str] | None = None
+    pending_action_types: Collection[str] | None = None
     pending_allowed_targets: set[int] | None = None
     pending_request_id: str | None = None
 
     def begin_input(
         self,
         *,
-        allowed_action_types: set[str] | None = None,
+        allowed_action_types: Collection[str] | None = None,
         allowed_targets: set[int] | None = None,
         request_id: str | None = None,
     ) -> asyncio.Future[dict[str, Any]]:
@@ -103,31 +100,25 @@ class AIPlayer(Player):
     def adjust_suspicion(self, seat_id: int, delta: int) -> None:
         if seat_id == self.seat_id:
             return
-        self.suspicion_scores[seat_id] = max(
-            0,
-            self.suspicion_scores.get(seat_id, 0) + delta,
-        )
-        if self.suspicion_scores[seat_id] == 0:
-            self.suspicion_scores.pop(seat_id, None)
+        scores = self.suspicion_scores
+        score = max(0, scores.get(seat_id, 0) + delta)
+        if score:
+            scores[seat_id] = score
+        else:
+            scores.pop(seat_id, None)
 
     def adjust_trust(self, seat_id: int, delta: int) -> None:
         if seat_id == self.seat_id:
             return
-        self.trust_scores[seat_id] = max(
-            0,
-            self.trust_scores.get(seat_id, 0) + delta,
-        )
-        if self.trust_scores[seat_id] == 0:
-            self.trust_scores.pop(seat_id, None)
+        scores = self.trust_scores
+        score = max(0, scores.get(seat_id, 0) + delta)
+        if score:
+            scores[seat_id] = score
+        else:
+            scores.pop(seat_id, None)
 
     def top_suspicions(self, *, limit: int = 3) -> list[tuple[int, int]]:
-        return sorted(
-            self.suspicion_scores.items(),
-            key=lambda item: (-item[1], item[0]),
-        )[:limit]
+        return sorted(self.suspicion_scores.items(), key=_score_rank)[:limit]
 
     def top_trusts(self, *, limit: int = 3) -> list[tuple[int, int]]:
-        return sorted(
-            self.trust_scores.items(),
-            key=lambda item: (-item[1], item[0]),
-        )[:limit]
+        return sorted(self.trust_scores.items(), key=_score_rank)[:limit]
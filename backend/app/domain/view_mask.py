@@ -1,38 +1,32 @@
 from typing import Any
 
-from app.domain.enums import Role
+from app.domain.enums import ROLE_CODES, Role
 from app.domain.game_context import GameContext
 
 
 def build_player_view(context: GameContext, viewer_seat: int) -> dict[str, Any]:
-    viewer = context.players[viewer_seat]
-    known_wolf_seats = set[int]()
-
-    if viewer.role is Role.WOLF:
-        known_wolf_seats = {
-            player.seat_id
-            for player in context.players.values()
-            if player.role is Role.WOLF
-        }
+    viewer_role = context.players[viewer_seat].role
+    known_wolf_mask = context.role_masks.get(Role.WOLF, 0) if viewer_role is Role.WOLF else 0
 
     players_view = []
     for seat_id, player in sorted(context.players.items()):
+        is_self = seat_id == viewer_seat
         known_role: str | None = None
-        if seat_id == viewer_seat:
-            known_role = player.role.value
-        elif seat_id in known_wolf_seats:
-            known_role = Role.WOLF.value
+        if is_self:
+            known_role = ROLE_CODES[player.role]
+        elif known_wolf_mask >> seat_id & 1:
+            known_role = ROLE_CODES[Role.WOLF]
 
         players_view.append(
             {
                 "seat_id": seat_id,
                 "is_alive": player.is_alive,
-                "is_self": seat_id == viewer_seat,
+                "is_self": is_self,
                 "known_role": known_role,
             }
         )
 
-    reveal_killed_tonight = viewer.role is Role.WITCH
+    reveal_killed_tonight = viewer_role is Role.WITCH
 
     return {
         "day_count": context.day_count,
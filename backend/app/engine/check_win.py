@@ -1,6 +1,6 @@
 from typing import Literal, TypedDict
 
-from app.domain.enums import Role
+from app.domain.enums import SPECIAL_ROLES, Role
 from app.domain.game_context import GameContext
 
 WinningSide = Literal["GOOD", "WOLF"]
@@ -12,33 +12,25 @@ class WinCheckResult(TypedDict):
 
 
 def check_win(context: GameContext) -> WinCheckResult | None:
-    alive_roles = [
-        player.role
-        for player in context.players.values()
-        if player.is_alive
-    ]
-
-    alive_wolves = [role for role in alive_roles if role is Role.WOLF]
-    alive_villagers = [role for role in alive_roles if role is Role.VILLAGER]
-    alive_specials = [
-        role
-        for role in alive_roles
-        if role in {Role.SEER, Role.WITCH, Role.HUNTER}
-    ]
-
-    if not alive_wolves:
+    alive_mask = context.alive_mask()
+    role_masks = context.role_masks
+    special_mask = 0
+    for role in SPECIAL_ROLES:
+        special_mask |= role_masks.get(role, 0)
+
+    if not alive_mask & role_masks.get(Role.WOLF, 0):
         return {
             "winning_side": "GOOD",
             "summary": "狼人已全部出局，好人阵营获胜。",
         }
 
-    if not alive_villagers:
+    if not alive_mask & role_masks.get(Role.VILLAGER, 0):
         return {
             "winning_side": "WOLF",
             "summary": "平民已全部出局，狼人阵营获胜。",
         }
 
-    if not alive_specials:
+    if not alive_mask & special_mask:
         return {
             "winning_side": "WOLF",
             "summary": "神职已全部出局，狼人阵营获胜。",
@@ -20,19 +20,24 @@ def _remember_vote_choices(
     abstentions: list[int],
     summary: str,
 ) -> None:
-    for voter_seat, target_seat in sorted(ballots.items()):
-        voter = context.players[voter_seat]
+    players = context.players
+    result_line = f"票型结果：{summary}"
+    # resolve_voting fills ballots and abstentions in seat order already.
+    for voter_seat, target_seat in ballots.items():
+        voter = players[voter_seat]
         if isinstance(voter, AIPlayer):
-            voter.remember(f"我上一轮投票给 {target_seat}号。票型结果：{summary}")
+            voter.remember(f"我上一轮投票给 {target_seat}号。{result_line}")
 
-        target = context.players[target_seat]
-        if isinstance(target, AIPlayer) and target_seat != voter_seat:
-            target.remember(f"{voter_seat}号上一轮投票打了你。票型结果：{summary}")
+        if target_seat == voter_seat:
+            continue
+        target = players[target_seat]
+        if isinstance(target, AIPlayer):
+            target.remember(f"{voter_seat}号上一轮投票打了你。{result_line}")
 
-    for voter_seat in sorted(abstentions):
-        voter = context.players[voter_seat]
+    for voter_seat in abstentions:
+        voter = players[voter_seat]
         if isinstance(voter, AIPlayer):
-            voter.remember(f"我上一轮选择弃票。票型结果：{summary}")
+            voter.remember(f"我上一轮选择弃票。{result_line}")
 
 
 def resolve_voting(
@@ -40,7 +45,7 @@ def resolve_voting(
     *,
     votes_by_voter: dict[int, int | None],
 ) -> VotingResult:
-    alive_seats = set(context.alive_seat_ids())
+    alive_seats = set(context.alive_seats())
     if set(votes_by_voter) != alive_seats:
         raise ValueError("all alive players must vote or abstain")
 
@@ -12,7 +12,7 @@ from app.engine.night.hunter_shooting import resolve_hunter_shooting
 from app.engine.night.seer_action import resolve_seer_action
 from app.engine.night.witch_action import WitchResources, resolve_witch_action
 from app.engine.night.wolf_action import resolve_wolf_action
-from app.engine.states.phase import GamePhase
+from app.engine.states.phase import PHASE_CODES, GamePhase
 from app.llm.builders import build_night_prompt, build_speech_prompt, build_vote_prompt
 from app.llm.fallback import FallbackLLMClient
 from app.llm.phrasebook import render_default_speech
@@ -33,12 +33,13 @@ class GameEngine:
         self._ai_speech_counter = 0
 
     def _ensure_witch_resources(self, context: GameContext) -> None:
+        witch_resources = self._witch_resources
         for seat_id, player in context.players.items():
-            if player.role is Role.WITCH:
-                self._witch_resources.setdefault(seat_id, WitchResources())
+            if player.role is Role.WITCH and seat_id not in witch_resources:
+                witch_resources[seat_id] = WitchResources()
 
     async def _set_phase(self, context: GameContext, phase: GamePhase) -> None:
-        context.phase = phase.value
+        context.phase = PHASE_CODES[phase]
         await self._notify_phase_changed(context)
 
     def _first_alive_seat_by_role(self, context: GameContext, role: Role) -> int | None:
@@ -155,12 +156,13 @@ class GameEngine:
         if resources.has_antidote and context.killed_tonight:
             return None
 
+        killed_tonight = set(context.killed_tonight)
         valid_targets = [
             seat_id
             for seat_id, player in sorted(context.players.items())
             if player.is_alive
             and seat_id != witch_seat
-            and seat_id not in context.killed_tonight
+            and seat_id not in killed_tonight
         ]
         if not valid_targets:
             return None
@@ -261,6 +263,9 @@ class GameEngine:
         if result.shot_seat is not None:
             await self._notify_player_state(context, [result.shot_seat])
 
+        return await self._finish_if_won(context)
+
+    async def _finish_if_won(self, context: GameContext) -> bool:
         winner = check_win(context)
         if winner is None:
             return False
@@ -384,13 +389,14 @@ class GameEngine:
         return None if response.vote_target == 0 else response.vote_target
 
     async def _build_votes(self, context: GameContext) -> dict[int, int | None]:
-        alive_seats = context.alive_seat_ids()
+        alive_seats = context.alive_seats()
+        players = context.players
+        use_llm = self._llm_client is not None
         votes: dict[int, int | None] = {}
 
         for seat_id in alive_seats:
             candidates = [candidate for candidate in alive_seats if candidate != seat_id]
-            player = context.players[seat_id]
-            if isinstance(player, HumanPlayer):
+            if isinstance(players[seat_id], HumanPlayer):
                 votes[seat_id] = await self._human_vote(
                     seat_id,
                     allowed_targets=candidates,
@@ -403,7 +409,7 @@ class GameEngine:
                     seat_id,
                     allowed_targets=candidates,
                 )
-                if self._llm_client is not None
+                if use_llm
                 else await self._ai_vote(
                     seat_id,
                     allowed_targets=candidates,
@@ -426,10 +432,7 @@ class GameEngine:
         self._ensure_witch_resources(game_context)
 
         await self._set_phase(game_context, GamePhase.CHECK_WIN)
-        winner = check_win(game_context)
-        if winner is not None:
-            await self._set_phase(game_context, GamePhase.GAME_OVER)
-            game_context.add_public_message(winner["summary"], event_type="GAME_OVER_SUMMARY")
+        if await self._finish_if_won(game_context):
             return game_context
 
         for _ in range(max_rounds):
@@ -453,7 +456,7 @@ class GameEngine:
                 await self._set_phase(game_context, GamePhase.SEER_ACTION)
                 seer_targets = [
                     seat_id
-                    for seat_id in game_context.alive_seat_ids()
+                    for seat_id in game_context.alive_seats()
                     if seat_id != seer_seat
                 ]
                 if seer_targets:
@@ -482,12 +485,13 @@ class GameEngine:
                     for seat_id in game_context.killed_tonight
                     if seat_id != witch_seat
                 ]
+                killed_tonight = set(game_context.killed_tonight)
                 poison_candidates = [
                     seat_id
                     for seat_id, player in sorted(game_context.players.items())
                     if player.is_alive
                     and seat_id != witch_seat
-                    and seat_id not in game_context.killed_tonight
+                    and seat_id not in killed_tonight
                 ]
                 save_target, poison_target = await self._select_witch_action(
                     game_context,
@@ -538,10 +542,7 @@ class GameEngine:
                 ):
                     return game_context
 
-            winner = check_win(game_context)
-            if winner is not None:
-                await self._set_phase(game_context, GamePhase.GAME_OVER)
-                game_context.add_public_message(winner["summary"], event_type="GAME_OVER_SUMMARY")
+            if await self._finish_if_won(game_context):
                 return game_context
 
             if announcement.eligible_last_words:
@@ -629,10 +630,7 @@ class GameEngine:
                 await self._set_phase(game_context, GamePhase.BANISH_LAST_WORDS)
                 await self._run_last_words(game_context, [banished_seat])
 
-            winner = check_win(game_context)
-            if winner is not None:
-                await self._set_phase(game_context, GamePhase.GAME_OVER)
-                game_context.add_public_message(winner["summary"], event_type="GAME_OVER_SUMMARY")
+            if await self._finish_if_won(game_context):
                 return game_context
 
             game_context.day_count += 1
@@ -47,7 +47,7 @@ def initialize_game(*, rng: random.Random | None = None) -> InitResult:
     context = GameContext(phase="INIT")
     context.add_public_message("游戏开始，分配身份完毕。")
 
-    personality_index = 0
+    personalities = iter(shuffled_personalities)
     human_role = Role.VILLAGER
 
     for seat_id, role in enumerate(shuffled_roles, start=1):
@@ -60,10 +60,9 @@ def initialize_game(*, rng: random.Random | None = None) -> InitResult:
             AIPlayer(
                 seat_id=seat_id,
                 role=role,
-                personality=shuffled_personalities[personality_index],
+                personality=next(personalities),
             )
         )
-        personality_index += 1
 
     return InitResult(
         context=context,
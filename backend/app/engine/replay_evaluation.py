@@ -16,6 +16,9 @@ from app.llm.phrasebook import TABLE_TALK_TERMS, TACTIC_STYLE_HINTS
 DEFAULT_REPLAY_SEED_COUNT = 20
 DEFAULT_REPLAY_MAX_ROUNDS = 20
 CAPPED_GAME_SUMMARY = "夜尽未分胜负，本局暂止。"
+_TABLE_TALK_TERMS = tuple(term for term in TABLE_TALK_TERMS if term)
+_TACTIC_LABELS = tuple(label for label in TACTIC_STYLE_HINTS if label)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
 PRIVATE_LEAK_MARKERS = (
     "private_log",
     "known_role",
@@ -225,8 +228,8 @@ def analyze_replay_quality(context: GameContext) -> ReplayQualityMetrics:
         else:
             unique_speech_messages.add(message)
 
-    table_talk_term_hits = _count_term_hits(speech_messages, TABLE_TALK_TERMS)
-    tactic_label_hits = _count_term_hits(speech_messages, TACTIC_STYLE_HINTS.keys())
+    table_talk_term_hits = _count_term_hits(speech_messages, _TABLE_TALK_TERMS)
+    tactic_label_hits = _count_term_hits(speech_messages, _TACTIC_LABELS)
     ballot_count = sum(len(vote.ballots) for vote in context.vote_history)
     abstention_count = sum(len(vote.abstentions) for vote in context.vote_history)
 
@@ -361,12 +364,11 @@ def _safe_rate(numerator: int, denominator: int) -> float:
 
 
 def _normalize_speech(message: str) -> str:
-    return re.sub(r"\s+", " ", message).strip().lower()
+    return _WHITESPACE_PATTERN.sub(" ", message).strip().lower()
 
 
-def _count_term_hits(messages: Iterable[str], terms: Iterable[str]) -> int:
-    term_list = tuple(term for term in terms if term)
-    return sum(message.count(term) for message in messages for term in term_list)
+def _count_term_hits(messages: Iterable[str], terms: tuple[str, ...]) -> int:
+    return sum(message.count(term) for message in messages for term in terms)
 
 
 def _final_game_summary(context: GameContext) -> str:
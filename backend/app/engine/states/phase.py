@@ -17,3 +17,6 @@ class GamePhase(StrEnum):
     VOTE_RESULT = "VOTE_RESULT"
     BANISH_LAST_WORDS = "BANISH_LAST_WORDS"
     GAME_OVER = "GAME_OVER"
+
+
+PHASE_CODES: dict[GamePhase, str] = {phase: phase.value for phase in GamePhase}
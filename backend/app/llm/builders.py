@@ -18,6 +18,8 @@ from app.llm.schemas import PromptEnvelope
 from app.llm.tactics import select_ai_tactic
 from app.llm.phrasebook import phrasebook_prompt_guide
 
+_SEAT_LABELS = {seat_id: f"{seat_id}号" for seat_id in range(1, 10)}
+
 
 def _objective_for_role(role: Role) -> str:
     return WOLF_SIDE_OBJECTIVE if role is Role.WOLF else GOOD_SIDE_OBJECTIVE
@@ -31,7 +33,9 @@ def _players_from_view(view: dict[str, object]) -> list[dict[str, object]]:
 
 
 def _seat_label(seat_id: object) -> str:
-    return f"{seat_id}号" if isinstance(seat_id, int) else "未知座位"
+    if not isinstance(seat_id, int):
+        return "未知座位"
+    return _SEAT_LABELS.get(seat_id) or f"{seat_id}号"
 
 
 def _seat_list(seats: list[int]) -> str:
@@ -88,23 +92,15 @@ def _situation_summary(view: dict[str, object]) -> str:
     )
 
 
-def _own_public_statements(view: dict[str, object], seat_id: int) -> list[str]:
-    history = view.get("public_chat_history")
-    if not isinstance(history, list):
-        return []
-    prefix = f"{seat_id}号发言："
-    return [
-        message
-        for message in history
-        if isinstance(message, str) and message.startswith(prefix)
-    ][-5:]
+def _own_public_statements(context: GameContext, seat_id: int) -> list[str]:
+    return context.public_speech_log.get(seat_id, [])[-5:]
 
 
 def _recent_public_history(view: dict[str, object]) -> list[str]:
     history = view.get("public_chat_history")
     if not isinstance(history, list):
         return []
-    return [message for message in history if isinstance(message, str)][-12:]
+    return [message for message in history[-12:] if isinstance(message, str)]
 
 
 def _last_vote_line(context: GameContext, seat_id: int) -> str | None:
@@ -119,17 +115,11 @@ def _last_vote_line(context: GameContext, seat_id: int) -> str | None:
 
 
 def _wolf_team_context(context: GameContext, seat_id: int) -> str:
-    living_wolves = [
-        player.seat_id
-        for player in context.players.values()
-        if player.role is Role.WOLF and player.is_alive
-    ]
-    dead_wolves = [
-        player.seat_id
-        for player in context.players.values()
-        if player.role is Role.WOLF and not player.is_alive
-    ]
-    teammates = [wolf_seat for wolf_seat in sorted(living_wolves) if wolf_seat != seat_id]
+    wolf_mask = context.role_masks.get(Role.WOLF, 0)
+    living_mask = wolf_mask & context.alive_mask()
+    living_wolves = context.seats_in_mask(living_mask)
+    dead_wolves = context.seats_in_mask(wolf_mask & ~living_mask)
+    teammates = context.seats_in_mask(living_mask & ~(1 << seat_id))
     if not teammates:
         pressure = "你可能是场上最后一张狼，发言应更保守，避免无理由冲锋。"
     elif len(living_wolves) >= 3:
@@ -142,11 +132,11 @@ def _wolf_team_context(context: GameContext, seat_id: int) -> str:
 
 def _seer_check_chain(context: GameContext, seat_id: int) -> str:
     checks: list[str] = []
-    checked_targets: set[int] = set()
+    checked_mask = 0
     for night in context.night_actions:
         if night.seer_seat != seat_id or night.seer_target is None:
             continue
-        checked_targets.add(night.seer_target)
+        checked_mask |= 1 << night.seer_target
         if night.seer_result == "WOLF":
             result = "狼人"
         elif night.seer_result == "GOOD":
@@ -160,7 +150,7 @@ def _seer_check_chain(context: GameContext, seat_id: int) -> str:
         for player in context.players.values()
         if player.is_alive
         and player.seat_id != seat_id
-        and player.seat_id not in checked_targets
+        and not checked_mask >> player.seat_id & 1
     ]
     chain = "；".join(checks) if checks else "暂无验人链"
     badge_flow = _seat_list(unchecked_alive[:2])
@@ -213,7 +203,7 @@ def _context_section(
         f"本轮战术目标：{select_ai_tactic(context, seat_id).to_prompt_line()}\n"
         f"战术连续性提示：{_strategic_continuity(context, seat_id)}\n"
         f"立场摘要：{_ai_stance_summary(context, seat_id)}\n"
-        f"你的既往公开发言：{_stable_json(_own_public_statements(view, seat_id))}\n"
+        f"你的既往公开发言：{_stable_json(_own_public_statements(context, seat_id))}\n"
         f"公开历史：{_stable_json(_recent_public_history(view))}\n"
         f"私有记忆：{_stable_json(_recent_private_memory(context, seat_id))}\n"
         f"玩家视图JSON：{_stable_json(view)}"
@@ -239,7 +229,7 @@ def build_speech_prompt(context: GameContext, *, seat_id: int) -> PromptEnvelope
             f"{phrasebook_prompt_guide()}"
         ),
         context_prompt=_context_section(context, view, personality, seat_id=seat_id),
-        task_prompt=SPEECH_TASK_TEMPLATE.format(seat_label=f"{seat_id}号"),
+        task_prompt=SPEECH_TASK_TEMPLATE.format(seat_label=_seat_label(seat_id)),
     )
 
 
@@ -1,9 +1,8 @@
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Protocol, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from app.llm.schemas import (
     PromptEnvelope,
@@ -58,6 +57,8 @@ class JSONModeClient:
             prompt=prompt,
             response_schema=response_schema,
         )
+        if isinstance(raw_response, str):
+            return _validate_response_text(raw_response, response_schema)
         payload = _coerce_payload(raw_response)
         return response_schema.model_validate(payload)
 
@@ -75,23 +76,27 @@ class JSONModeClient:
         return self.request(prompt=prompt, response_schema=TargetedActionResponse)
 
 
-def _coerce_payload(raw_response: str | Mapping[str, object]) -> dict[str, object]:
-    if isinstance(raw_response, Mapping):
-        return dict(raw_response)
-
-    if not isinstance(raw_response, str):
-        raise JSONModeError("provider response must be a JSON string or mapping")
-
+def _validate_response_text(
+    raw_response: str,
+    response_schema: type[ResponseModelT],
+) -> ResponseModelT:
     response_text = raw_response.strip()
     if not response_text:
         raise JSONModeError("provider response must not be empty")
 
     try:
-        payload = json.loads(response_text)
-    except json.JSONDecodeError as exc:
-        raise JSONModeError("provider response is not valid JSON") from exc
+        return response_schema.model_validate_json(response_text)
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False, include_context=False)
+        if any(error["type"] == "json_invalid" for error in errors):
+            raise JSONModeError("provider response is not valid JSON") from exc
+        if any(error["type"] == "model_type" and not error["loc"] for error in errors):
+            raise JSONModeError("provider response must decode to a JSON object") from exc
+        raise
 
-    if not isinstance(payload, dict):
-        raise JSONModeError("provider response must decode to a JSON object")
 
-    return payload
+def _coerce_payload(raw_response: object) -> dict[str, object]:
+    if isinstance(raw_response, Mapping):
+        return dict(raw_response)
+
+    raise JSONModeError("provider response must be a JSON string or mapping")
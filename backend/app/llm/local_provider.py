@@ -1,5 +1,7 @@
 import ast
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import re
 
@@ -14,6 +16,7 @@ from app.llm.phrasebook import (
 )
 from app.llm.schemas import PromptEnvelope, SpeechResponse, TargetedActionResponse, VoteResponse
 
+_SEER_CHECK_MARKER = "查验结果："
 _SEER_CHECK_PATTERN = re.compile(r"查验结果：\s*(\d+)\s*号是\s*(狼人|好人)")
 _SEER_WOLF_CHECK_PATTERN = re.compile(r"查验结果：\s*(\d+)\s*号是\s*狼人")
 _STANCE_ITEM_PATTERN = re.compile(r"(\d+)号\((\d+)\)")
@@ -23,8 +26,11 @@ _SEAT_PATTERN = re.compile(r"(\d+)号")
 
 
 def _extract_section(prompt: PromptEnvelope, label: str) -> str | None:
-    for line in prompt.context_prompt.splitlines():
-        prefix = f"{label}："
+    context_prompt = prompt.context_prompt
+    prefix = f"{label}："
+    if prefix not in context_prompt:
+        return None
+    for line in context_prompt.splitlines():
         if line.startswith(prefix):
             return line[len(prefix):].strip()
     return None
@@ -133,6 +139,8 @@ def _extract_day_count(prompt: PromptEnvelope) -> int | None:
 def _extract_checked_wolf_targets(prompt: PromptEnvelope) -> list[int]:
     checked_targets: list[int] = []
     for message in _extract_private_log(prompt):
+        if _SEER_CHECK_MARKER not in message:
+            continue
         match = _SEER_WOLF_CHECK_PATTERN.search(message)
         if match is not None:
             checked_targets.append(int(match.group(1)))
@@ -142,6 +150,8 @@ def _extract_checked_wolf_targets(prompt: PromptEnvelope) -> list[int]:
 def _extract_checked_results(prompt: PromptEnvelope) -> list[tuple[int, str]]:
     checked_results: list[tuple[int, str]] = []
     for message in _extract_private_log(prompt):
+        if _SEER_CHECK_MARKER not in message:
+            continue
         match = _SEER_CHECK_PATTERN.search(message)
         if match is not None:
             checked_results.append((int(match.group(1)), match.group(2)))
@@ -156,11 +166,16 @@ def _pick_checked_wolf_target(prompt: PromptEnvelope) -> int | None:
     return None
 
 
+@lru_cache(maxsize=None)
+def _stance_section_pattern(label: str) -> re.Pattern[str]:
+    return re.compile(fr"{label}：([^；]+)")
+
+
 def _extract_stance_targets(prompt: PromptEnvelope, label: str) -> list[int]:
     stance_line = _extract_section(prompt, "立场摘要")
     if not stance_line:
         return []
-    section_match = re.search(fr"{label}：([^；]+)", stance_line)
+    section_match = _stance_section_pattern(label).search(stance_line)
     if section_match is None:
         return []
     scored_seats = [
@@ -235,6 +250,115 @@ def _extract_killed_tonight(prompt: PromptEnvelope) -> list[int]:
     return [seat_id for seat_id in payload if isinstance(seat_id, int)]
 
 
+def _speech_response(prompt: PromptEnvelope) -> dict[str, object]:
+    if _extract_self_role(prompt) == "SEER":
+        checked_wolf = _pick_checked_wolf_target(prompt)
+        if checked_wolf is not None:
+            return {
+                "inner_thought": "预言家已有查杀，公开推动白天放逐。",
+                "speech_text": render_checked_wolf_speech(checked_wolf),
+            }
+        checked_results = _extract_checked_results(prompt)
+        if checked_results:
+            return {
+                "inner_thought": "预言家需要稳定复述验人链和后续查验顺序。",
+                "speech_text": render_checked_chain_speech(checked_results[-3:]),
+            }
+
+    self_seat = _extract_self_seat(prompt)
+    day_count = _extract_day_count(prompt)
+    tactic_speech = render_tactic_speech(
+        _extract_tactic_label(prompt),
+        _pick_tactic_target(prompt),
+        speaker_seat=self_seat,
+        variant_key=day_count,
+    )
+    if tactic_speech is not None:
+        return {
+            "inner_thought": "按本轮战术目标组织局内话术。",
+            "speech_text": tactic_speech,
+        }
+
+    suspected_target = _pick_stance_target(prompt)
+    if suspected_target is not None:
+        return {
+            "inner_thought": "延续已有怀疑对象，给出可被票型验证的公开压力。",
+            "speech_text": render_suspicion_speech(
+                suspected_target,
+                speaker_seat=self_seat,
+                variant_key=day_count,
+            ),
+        }
+
+    return {
+        "inner_thought": "先给出保守公开发言。",
+        "speech_text": render_default_speech(
+            speaker_seat=self_seat,
+            variant_key=day_count,
+        ),
+    }
+
+
+def _vote_response(prompt: PromptEnvelope) -> dict[str, object]:
+    checked_wolf = _pick_checked_wolf_target(prompt)
+    if _extract_self_role(prompt) == "SEER" and checked_wolf is not None:
+        return {
+            "inner_thought": "优先投给自己查验到的狼人。",
+            "vote_target": checked_wolf,
+        }
+
+    tactic_target = _pick_tactic_target(prompt)
+    if _extract_tactic_label(prompt) in {"归票", "冲锋", "倒钩"} and tactic_target is not None:
+        return {
+            "inner_thought": "按本轮战术目标集中票型。",
+            "vote_target": tactic_target,
+        }
+
+    suspected_target = _pick_stance_target(prompt)
+    if suspected_target is not None:
+        return {
+            "inner_thought": "延续当前怀疑分最高的对象投票。",
+            "vote_target": suspected_target,
+        }
+
+    targets = _extract_alive_targets(prompt)
+    return {
+        "inner_thought": "优先投给当前最靠前的合法目标。",
+        "vote_target": targets[0] if targets else 0,
+    }
+
+
+def _targeted_action_response(prompt: PromptEnvelope) -> dict[str, object]:
+    killed_tonight = _extract_killed_tonight(prompt)
+    if killed_tonight:
+        return {
+            "inner_thought": "夜里已经有人倒下，优先考虑救人。",
+            "target": None,
+            "use_antidote": True,
+            "use_poison": False,
+        }
+
+    target = _pick_tactic_target(prompt)
+    if target is None:
+        target = _pick_stance_target(prompt)
+    if target is None:
+        targets = _extract_alive_targets(prompt)
+        target = targets[0] if targets else None
+    return {
+        "inner_thought": "优先选择当前最有压力的合法目标。",
+        "target": target,
+        "use_antidote": False,
+        "use_poison": False,
+    }
+
+
+_RESPONSE_BUILDERS: dict[type[object], Callable[[PromptEnvelope], dict[str, object]]] = {
+    SpeechResponse: _speech_response,
+    VoteResponse: _vote_response,
+    TargetedActionResponse: _targeted_action_response,
+}
+
+
 @dataclass(slots=True)
 class LocalRuleBasedProvider(LLMProvider):
     def complete(
@@ -243,111 +367,10 @@ class LocalRuleBasedProvider(LLMProvider):
         prompt: PromptEnvelope,
         response_schema: type[object],
     ) -> dict[str, object]:
-        if response_schema is SpeechResponse:
-            self_role = _extract_self_role(prompt)
-            self_seat = _extract_self_seat(prompt)
-            tactic_label = _extract_tactic_label(prompt)
-            tactic_target = _pick_tactic_target(prompt)
-            checked_wolf = _pick_checked_wolf_target(prompt)
-            suspected_target = _pick_stance_target(prompt)
-            if self_role == "SEER" and checked_wolf is not None:
-                return {
-                    "inner_thought": "预言家已有查杀，公开推动白天放逐。",
-                    "speech_text": render_checked_wolf_speech(checked_wolf),
-                }
-            if self_role == "SEER":
-                checked_results = _extract_checked_results(prompt)
-                if checked_results:
-                    return {
-                        "inner_thought": "预言家需要稳定复述验人链和后续查验顺序。",
-                        "speech_text": render_checked_chain_speech(checked_results[-3:]),
-                    }
-
-            tactic_speech = render_tactic_speech(
-                tactic_label,
-                tactic_target,
-                speaker_seat=self_seat,
-                variant_key=_extract_day_count(prompt),
-            )
-            if tactic_speech is not None:
-                return {
-                    "inner_thought": "按本轮战术目标组织局内话术。",
-                    "speech_text": tactic_speech,
-                }
-
-            if suspected_target is not None:
-                return {
-                    "inner_thought": "延续已有怀疑对象，给出可被票型验证的公开压力。",
-                    "speech_text": render_suspicion_speech(
-                        suspected_target,
-                        speaker_seat=self_seat,
-                        variant_key=_extract_day_count(prompt),
-                    ),
-                }
-
-            return {
-                "inner_thought": "先给出保守公开发言。",
-                "speech_text": render_default_speech(
-                    speaker_seat=self_seat,
-                    variant_key=_extract_day_count(prompt),
-                ),
-            }
-
-        if response_schema is VoteResponse:
-            checked_wolf = _pick_checked_wolf_target(prompt)
-            if _extract_self_role(prompt) == "SEER" and checked_wolf is not None:
-                return {
-                    "inner_thought": "优先投给自己查验到的狼人。",
-                    "vote_target": checked_wolf,
-                }
-
-            tactic_target = _pick_tactic_target(prompt)
-            if _extract_tactic_label(prompt) in {"归票", "冲锋", "倒钩"} and tactic_target is not None:
-                return {
-                    "inner_thought": "按本轮战术目标集中票型。",
-                    "vote_target": tactic_target,
-                }
-
-            suspected_target = _pick_stance_target(prompt)
-            if suspected_target is not None:
-                return {
-                    "inner_thought": "延续当前怀疑分最高的对象投票。",
-                    "vote_target": suspected_target,
-                }
-
-            targets = _extract_alive_targets(prompt)
-            return {
-                "inner_thought": "优先投给当前最靠前的合法目标。",
-                "vote_target": targets[0] if targets else 0,
-            }
-
-        if response_schema is TargetedActionResponse:
-            killed_tonight = _extract_killed_tonight(prompt)
-            if killed_tonight:
-                return {
-                    "inner_thought": "夜里已经有人倒下，优先考虑救人。",
-                    "target": None,
-                    "use_antidote": True,
-                    "use_poison": False,
-                }
-
-            targets = _extract_alive_targets(prompt)
-            suspected_target = _pick_stance_target(prompt)
-            tactic_target = _pick_tactic_target(prompt)
-            return {
-                "inner_thought": "优先选择当前最有压力的合法目标。",
-                "target": (
-                    tactic_target
-                    if tactic_target is not None
-                    else suspected_target
-                    if suspected_target is not None
-                    else targets[0] if targets else None
-                ),
-                "use_antidote": False,
-                "use_poison": False,
-            }
-
-        raise TypeError(f"unsupported response schema: {response_schema}")
+        build_response = _RESPONSE_BUILDERS.get(response_schema)
+        if build_response is None:
+            raise TypeError(f"unsupported response schema: {response_schema}")
+        return build_response(prompt)
 
 
 def build_local_llm_client() -> FallbackLLMClient:
@@ -3,6 +3,7 @@ import os
 import re
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 import logging
 
@@ -15,6 +16,8 @@ from app.llm.schemas import PromptEnvelope
 DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 DEFAULT_OPENAI_TIMEOUT_SECONDS = 30.0
 _JSON_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+_RESPONSE_FORMAT_HINT_PATTERN = re.compile(r"response_format|json_object|json mode", re.IGNORECASE)
+_UNSUPPORTED_HINT_PATTERN = re.compile(r"unsupported|unknown|invalid|not support", re.IGNORECASE)
 _API_KEY_ENV_VARS = ("OPENAI_API_KEY", "STITCH_API_KEY")
 _MODEL_ENV_VARS = ("OPENAI_MODEL", "STITCH_MODEL")
 _BASE_URL_ENV_VARS = ("OPENAI_BASE_URL", "STITCH_BASE_URL")
@@ -181,13 +184,10 @@ def _validate_base_url(url: str) -> None:
             raise ValueError("LLM base URL must not point to a private network")
 
 
-def _build_messages(
-    *,
-    prompt: PromptEnvelope,
-    response_schema: type[BaseModel],
-) -> list[dict[str, str]]:
+@lru_cache(maxsize=None)
+def _schema_hint(response_schema: type[BaseModel]) -> str:
     schema_payload = response_schema.model_json_schema()
-    schema_hint = json.dumps(
+    return json.dumps(
         {
             "type": schema_payload.get("type", "object"),
             "properties": schema_payload.get("properties", {}),
@@ -195,6 +195,14 @@ def _build_messages(
         },
         ensure_ascii=False,
     )
+
+
+def _build_messages(
+    *,
+    prompt: PromptEnvelope,
+    response_schema: type[BaseModel],
+) -> list[dict[str, str]]:
+    schema_hint = _schema_hint(response_schema)
     system_content = (
         f"{prompt.system_prompt}\n\n"
         "额外输出要求：你必须只返回一个合法 JSON 对象，不要输出 Markdown、代码块或任何额外说明。\n"
@@ -324,16 +332,9 @@ def _should_retry_without_response_format(
         else:
             response_text = json.dumps(payload, ensure_ascii=False)
 
-    normalized_text = response_text.lower()
     return (
-        "response_format" in normalized_text
-        or "json_object" in normalized_text
-        or "json mode" in normalized_text
-    ) and (
-        "unsupported" in normalized_text
-        or "unknown" in normalized_text
-        or "invalid" in normalized_text
-        or "not support" in normalized_text
+        _RESPONSE_FORMAT_HINT_PATTERN.search(response_text) is not None
+        and _UNSUPPORTED_HINT_PATTERN.search(response_text) is not None
     )
 
 
@@ -47,7 +47,7 @@ def _variant_index(
     return seed % size
 
 
-def phrasebook_prompt_guide() -> str:
+def _build_prompt_guide() -> str:
     terms = "、".join(TABLE_TALK_TERMS)
     style_lines = "；".join(
         f"{label}：{hint}"
@@ -61,6 +61,13 @@ def phrasebook_prompt_guide() -> str:
     )
 
 
+_PROMPT_GUIDE = _build_prompt_guide()
+
+
+def phrasebook_prompt_guide() -> str:
+    return _PROMPT_GUIDE
+
+
 def render_checked_wolf_speech(checked_wolf: int) -> str:
     return (
         f"我是预言家，验人链先报清：{checked_wolf}号查杀。"
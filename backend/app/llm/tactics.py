@@ -15,6 +15,7 @@ TacticLabel = Literal[
     "归票",
     "保留身份",
 ]
+HOLD_ROLES = frozenset({Role.WITCH, Role.HUNTER})
 
 
 @dataclass(slots=True, kw_only=True)
@@ -47,7 +48,7 @@ def _select_wolf_tactic(context: GameContext, seat_id: int) -> AITactic:
         player,
         [
             candidate
-            for candidate in context.alive_seat_ids()
+            for candidate in context.alive_seats()
             if candidate != seat_id and context.players[candidate].role is not Role.WOLF
         ],
         minimum_score=1,
@@ -88,27 +89,28 @@ def _select_wolf_tactic(context: GameContext, seat_id: int) -> AITactic:
 
 def _select_good_tactic(context: GameContext, seat_id: int) -> AITactic:
     player = context.players[seat_id]
-    checked_wolf = _latest_alive_seer_check(context, seat_id, result="WOLF")
-    if player.role is Role.SEER and checked_wolf is not None:
-        return AITactic(
-            label="报验人",
-            objective="公开查杀并推动白天放逐。",
-            target_seats=[checked_wolf],
-            guidance="稳定复述验人链，明确今天优先出查杀。",
-        )
-
-    checked_good = _latest_alive_seer_check(context, seat_id, result="GOOD")
-    if player.role is Role.SEER and checked_good is not None:
-        return AITactic(
-            label="报验人",
-            objective="公开或半公开金水信息，建立可信视角。",
-            target_seats=[checked_good],
-            guidance="保护金水，同时给出下一晚查验方向。",
-        )
+    if player.role is Role.SEER:
+        checked_wolf = _latest_alive_seer_check(context, seat_id, result="WOLF")
+        if checked_wolf is not None:
+            return AITactic(
+                label="报验人",
+                objective="公开查杀并推动白天放逐。",
+                target_seats=[checked_wolf],
+                guidance="稳定复述验人链，明确今天优先出查杀。",
+            )
+
+        checked_good = _latest_alive_seer_check(context, seat_id, result="GOOD")
+        if checked_good is not None:
+            return AITactic(
+                label="报验人",
+                objective="公开或半公开金水信息，建立可信视角。",
+                target_seats=[checked_good],
+                guidance="保护金水，同时给出下一晚查验方向。",
+            )
 
     suspected_target = _first_scored_seat(
         player,
-        [candidate for candidate in context.alive_seat_ids() if candidate != seat_id],
+        [candidate for candidate in context.alive_seats() if candidate != seat_id],
         minimum_score=1,
     )
     if suspected_target is not None:
@@ -124,7 +126,7 @@ def _select_good_tactic(context: GameContext, seat_id: int) -> AITactic:
             ),
         )
 
-    if player.role in {Role.WITCH, Role.HUNTER}:
+    if player.role in HOLD_ROLES:
         return AITactic(
             label="保留身份",
             objective="不急着暴露神职身份，先观察发言和票型。",
@@ -141,11 +143,7 @@ def _select_good_tactic(context: GameContext, seat_id: int) -> AITactic:
 
 
 def _alive_seats_by_role(context: GameContext, role: Role) -> list[int]:
-    return [
-        seat_id
-        for seat_id, player in sorted(context.players.items())
-        if player.is_alive and player.role is role
-    ]
+    return context.seats_in_mask(context.role_masks.get(role, 0) & context.alive_mask())
 
 
 def _first_scored_seat(
@@ -169,7 +167,7 @@ def _latest_alive_seer_check(
     *,
     result: Literal["GOOD", "WOLF"],
 ) -> int | None:
-    alive_seats = set(context.alive_seat_ids())
+    alive_seats = set(context.alive_seats())
     for night in reversed(context.night_actions):
         if (
             night.seer_seat == seat_id
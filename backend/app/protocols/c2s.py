@@ -2,6 +2,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
 
+from app.domain.enums import TARGETED_INPUT_ACTION_TYPES
+
 
 class SubmitActionPayload(BaseModel):
     action_type: Literal[
@@ -20,14 +22,13 @@ class SubmitActionPayload(BaseModel):
 
     @model_validator(mode="after")
     def validate_shape(self) -> "SubmitActionPayload":
-        targeted_actions = {"VOTE", "WOLF_KILL", "SEER_CHECK", "HUNTER_SHOOT", "WITCH_POISON"}
-        text_actions = {"SPEAK"}
+        is_targeted = self.action_type in TARGETED_INPUT_ACTION_TYPES
 
-        if self.action_type in targeted_actions and self.target is None:
+        if is_targeted and self.target is None:
             raise ValueError("target is required for targeted actions")
-        if self.action_type not in targeted_actions and self.target is not None:
+        if not is_targeted and self.target is not None:
             raise ValueError("target is only allowed for targeted actions")
-        if self.action_type in text_actions and (self.text is None or not self.text.strip()):
+        if self.action_type == "SPEAK" and (self.text is None or not self.text.strip()):
             raise ValueError("text is required for speech actions")
 
         return self
@@ -1,26 +1,30 @@
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class SystemMessagePayload(BaseModel):
+class ServerModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+
+class SystemMessagePayload(ServerModel):
     message: str = Field(min_length=1)
 
 
-class ChatUpdatePayload(BaseModel):
+class ChatUpdatePayload(ServerModel):
     message: str = Field(min_length=1)
     seat_id: int | None = None
     speaker: str | None = None
     visibility: Literal["public", "private"] = "public"
 
 
-class AIThinkingPayload(BaseModel):
+class AIThinkingPayload(ServerModel):
     seat_id: int = Field(ge=1, le=9)
     is_thinking: bool
     message: str | None = None
 
 
-class PlayerStatePatch(BaseModel):
+class PlayerStatePatch(ServerModel):
     seat_id: int = Field(ge=1, le=9)
     is_alive: bool | None = None
     is_human: bool | None = None
@@ -28,22 +32,22 @@ class PlayerStatePatch(BaseModel):
     is_thinking: bool | None = None
 
 
-class PlayerStatePatchPayload(BaseModel):
+class PlayerStatePatchPayload(ServerModel):
     players: list[PlayerStatePatch] = Field(min_length=1)
 
 
-class PhaseChangedPayload(BaseModel):
+class PhaseChangedPayload(ServerModel):
     phase: str = Field(min_length=1)
     day_count: int = Field(ge=1)
 
 
-class DeathRevealedPayload(BaseModel):
+class DeathRevealedPayload(ServerModel):
     dead_seats: list[int] = Field(default_factory=list)
     eligible_last_words: list[int] = Field(default_factory=list)
     day_count: int = Field(ge=1)
 
 
-class VoteResolvedPayload(BaseModel):
+class VoteResolvedPayload(ServerModel):
     votes: dict[int, int] = Field(default_factory=dict)
     ballots: dict[int, int] = Field(default_factory=dict)
     abstentions: list[int] = Field(default_factory=list)
@@ -51,7 +55,7 @@ class VoteResolvedPayload(BaseModel):
     summary: str = Field(min_length=1)
 
 
-class SettlementPlayerPayload(BaseModel):
+class SettlementPlayerPayload(ServerModel):
     seat_id: int = Field(ge=1, le=9)
     role_code: str = Field(min_length=1)
     side: Literal["GOOD", "WOLF"]
@@ -59,7 +63,7 @@ class SettlementPlayerPayload(BaseModel):
     is_human: bool
 
 
-class SettlementEventPayload(BaseModel):
+class SettlementEventPayload(ServerModel):
     day_count: int = Field(ge=1)
     phase: str = Field(min_length=1)
     event_type: str = Field(min_length=1)
@@ -68,7 +72,7 @@ class SettlementEventPayload(BaseModel):
     target_seats: list[int] = Field(default_factory=list)
 
 
-class SettlementNightPayload(BaseModel):
+class SettlementNightPayload(ServerModel):
     day_count: int = Field(ge=1)
     wolf_target: int | None = Field(default=None, ge=1, le=9)
     seer_seat: int | None = Field(default=None, ge=1, le=9)
@@ -80,20 +84,20 @@ class SettlementNightPayload(BaseModel):
     dead_seats: list[int] = Field(default_factory=list)
 
 
-class SettlementSpeechPayload(BaseModel):
+class SettlementSpeechPayload(ServerModel):
     seat_id: int = Field(ge=1, le=9)
     message: str = Field(min_length=1)
     event_type: str = Field(min_length=1)
 
 
-class SettlementDayPayload(BaseModel):
+class SettlementDayPayload(ServerModel):
     day_count: int = Field(ge=1)
     speeches: list[SettlementSpeechPayload] = Field(default_factory=list)
     vote: VoteResolvedPayload | None = None
     vote_explanation: str | None = None
 
 
-class SettlementRecapPayload(BaseModel):
+class SettlementRecapPayload(ServerModel):
     day_count: int = Field(ge=1)
     outcome_reason: str = Field(min_length=1)
     role_reveal_summary: str = Field(min_length=1)
@@ -105,7 +109,7 @@ class SettlementRecapPayload(BaseModel):
     final_vote: VoteResolvedPayload | None = None
 
 
-class RequireInputPayload(BaseModel):
+class RequireInputPayload(ServerModel):
     action_type: Literal["SPEAK", "VOTE", "WOLF_KILL", "SEER_CHECK", "HUNTER_SHOOT", "WITCH_ACTION"]
     request_id: str = Field(min_length=1)
     prompt: str = Field(min_length=1)
@@ -114,62 +118,62 @@ class RequireInputPayload(BaseModel):
     save_targets: list[int] | None = None
 
 
-class GameOverPayload(BaseModel):
+class GameOverPayload(ServerModel):
     winning_side: Literal["GOOD", "WOLF", "DRAW"]
     summary: str = Field(min_length=1)
     revealed_roles: dict[int, str] = Field(default_factory=dict)
     recap: SettlementRecapPayload | None = None
 
 
-class SystemMessageEnvelope(BaseModel):
+class SystemMessageEnvelope(ServerModel):
     type: Literal["SYSTEM_MSG"]
     data: SystemMessagePayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class ChatUpdateEnvelope(BaseModel):
+class ChatUpdateEnvelope(ServerModel):
     type: Literal["CHAT_UPDATE"]
     data: ChatUpdatePayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class AIThinkingEnvelope(BaseModel):
+class AIThinkingEnvelope(ServerModel):
     type: Literal["AI_THINKING"]
     data: AIThinkingPayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class PlayerStatePatchEnvelope(BaseModel):
+class PlayerStatePatchEnvelope(ServerModel):
     type: Literal["PLAYER_STATE_PATCH"]
     data: PlayerStatePatchPayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class PhaseChangedEnvelope(BaseModel):
+class PhaseChangedEnvelope(ServerModel):
     type: Literal["PHASE_CHANGED"]
     data: PhaseChangedPayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class DeathRevealedEnvelope(BaseModel):
+class DeathRevealedEnvelope(ServerModel):
     type: Literal["DEATH_REVEALED"]
     data: DeathRevealedPayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class VoteResolvedEnvelope(BaseModel):
+class VoteResolvedEnvelope(ServerModel):
     type: Literal["VOTE_RESOLVED"]
     data: VoteResolvedPayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class RequireInputEnvelope(BaseModel):
+class RequireInputEnvelope(ServerModel):
     type: Literal["REQUIRE_INPUT"]
     data: RequireInputPayload
     meta: dict[str, Any] = Field(default_factory=dict)
 
 
-class GameOverEnvelope(BaseModel):
+class GameOverEnvelope(ServerModel):
     type: Literal["GAME_OVER"]
     data: GameOverPayload
     meta: dict[str, Any] = Field(default_factory=dict)
@@ -1,4 +1,5 @@
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic_core import to_json
 from starlette.websockets import WebSocketState
 
 
@@ -22,7 +23,7 @@ class ConnectionManager:
             self.disconnect(websocket)
             return
         try:
-            await websocket.send_json(payload)
+            await websocket.send_text(to_json(payload).decode())
         except (RuntimeError, WebSocketDisconnect, OSError):
             self.disconnect(websocket)
             return
@@ -1,12 +1,13 @@
 import asyncio
 import logging
+from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from typing import Literal
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from app.domain.enums import Role
+from app.domain.enums import ROLE_CODES, SPECIAL_ROLES, Role
 from app.domain.game_context import GameContext, PrivateChatEvent, PublicChatEvent, VoteSnapshot
 from app.domain.player import HumanPlayer
 from app.engine.check_win import check_win
@@ -24,9 +25,7 @@ from app.protocols.s2c import (
     GameOverPayload,
     PhaseChangedEnvelope,
     PhaseChangedPayload,
-    PlayerStatePatch,
     PlayerStatePatchEnvelope,
-    PlayerStatePatchPayload,
     RequireInputEnvelope,
     RequireInputPayload,
     SettlementDayPayload,
@@ -51,7 +50,16 @@ CloseConnection = Callable[[], Awaitable[None]]
 GAME_OVER_CLOSE_CODE = 4000
 GAME_OVER_CLOSE_REASON = "game_over"
 MAX_AI_THINKING_DELAY_SECONDS = 2.0
-SETTLEMENT_EVENT_TYPES = {
+SUBMIT_ACTION_TYPES_BY_INPUT: dict[str, frozenset[str]] = {
+    "SPEAK": frozenset({"SPEAK"}),
+    "VOTE": frozenset({"VOTE", "PASS"}),
+    "WOLF_KILL": frozenset({"WOLF_KILL"}),
+    "SEER_CHECK": frozenset({"SEER_CHECK"}),
+    "HUNTER_SHOOT": frozenset({"HUNTER_SHOOT"}),
+    "WITCH_ACTION": frozenset({"WITCH_SAVE", "WITCH_POISON", "PASS"}),
+}
+SETTLEMENT_TIMELINE_ADAPTER = TypeAdapter(list[SettlementEventPayload])
+SETTLEMENT_EVENT_TYPES = frozenset({
     "NIGHT_DEATH",
     "PEACEFUL_NIGHT",
     "BANISHMENT",
@@ -61,7 +69,7 @@ SETTLEMENT_EVENT_TYPES = {
     "HUNTER_NO_TARGET",
     "LAST_WORDS",
     "GAME_OVER_SUMMARY",
-}
+})
 
 
 def build_system_message(
@@ -149,24 +157,29 @@ def build_player_state_patch_message(
     reveal_role_seats: set[int] | None = None,
 ) -> dict[str, object]:
     role_seats = reveal_role_seats or set()
-    return PlayerStatePatchEnvelope(
-        type="PLAYER_STATE_PATCH",
-        data=PlayerStatePatchPayload(
-            players=[
-                PlayerStatePatch(
-                    seat_id=seat_id,
-                    is_alive=context.players[seat_id].is_alive,
-                    is_human=isinstance(context.players[seat_id], HumanPlayer),
-                    role_code=(
-                        context.players[seat_id].role.value
-                        if reveal_roles or seat_id in role_seats
-                        else None
-                    ),
-                    is_thinking=False,
-                )
-                for seat_id in seat_ids
-            ],
-        ),
+    players = context.players
+    # Validate the whole envelope from plain dicts in one pydantic-core call
+    # instead of constructing one PlayerStatePatch model per seat in Python.
+    return PlayerStatePatchEnvelope.model_validate(
+        {
+            "type": "PLAYER_STATE_PATCH",
+            "data": {
+                "players": [
+                    {
+                        "seat_id": seat_id,
+                        "is_alive": players[seat_id].is_alive,
+                        "is_human": isinstance(players[seat_id], HumanPlayer),
+                        "role_code": (
+                            ROLE_CODES[players[seat_id].role]
+                            if reveal_roles or seat_id in role_seats
+                            else None
+                        ),
+                        "is_thinking": False,
+                    }
+                    for seat_id in seat_ids
+                ],
+            },
+        }
     ).model_dump()
 
 
@@ -251,14 +264,10 @@ def allowed_submit_action_types(
     action_type: Literal["SPEAK", "VOTE", "WOLF_KILL", "SEER_CHECK", "HUNTER_SHOOT", "WITCH_ACTION"],
     *,
     available_actions: list[Literal["WITCH_SAVE", "WITCH_POISON", "PASS"]] | None = None,
-) -> set[str]:
-    if action_type == "VOTE":
-        return {"VOTE", "PASS"}
-    if action_type == "WITCH_ACTION":
-        if available_actions is None:
-            return {"WITCH_SAVE", "WITCH_POISON", "PASS"}
-        return set(available_actions)
-    return {action_type}
+) -> frozenset[str]:
+    if action_type == "WITCH_ACTION" and available_actions is not None:
+        return frozenset(available_actions)
+    return SUBMIT_ACTION_TYPES_BY_INPUT[action_type]
 
 
 def role_side(role: Role) -> Literal["GOOD", "WOLF"]:
@@ -312,7 +321,7 @@ def build_role_reveal_summary(context: GameContext) -> str:
     gods = [
         seat_id
         for seat_id, player in sorted(context.players.items())
-        if player.role in {Role.SEER, Role.WITCH, Role.HUNTER}
+        if player.role in SPECIAL_ROLES
     ]
     villagers = [
         seat_id
@@ -328,7 +337,7 @@ def build_role_reveal_summary(context: GameContext) -> str:
 
 
 def build_settlement_timeline(context: GameContext) -> list[SettlementEventPayload]:
-    timeline: list[SettlementEventPayload] = []
+    timeline: list[dict[str, object]] = []
     for event in context.public_chat_events:
         event_type = event.event_type
         if event_type is None and event.message_kind == "speech":
@@ -336,16 +345,16 @@ def build_settlement_timeline(context: GameContext) -> list[SettlementEventPaylo
         if event_type is None:
             event_type = "PUBLIC_MESSAGE"
         timeline.append(
-            SettlementEventPayload(
-                day_count=event.day_count,
-                phase=event.phase,
-                event_type=event_type,
-                message=event.message,
-                actor_seat=event.actor_seat,
-                target_seats=list(event.target_seats),
-            )
+            {
+                "day_count": event.day_count,
+                "phase": event.phase,
+                "event_type": event_type,
+                "message": event.message,
+                "actor_seat": event.actor_seat,
+                "target_seats": event.target_seats,
+            }
         )
-    return timeline
+    return SETTLEMENT_TIMELINE_ADAPTER.validate_python(timeline)
 
 
 def build_settlement_days(context: GameContext) -> list[SettlementDayPayload]:
@@ -361,8 +370,6 @@ def build_settlement_days(context: GameContext) -> list[SettlementDayPayload]:
             )
         )
 
-    from collections import defaultdict
-
     votes_by_day: dict[int, list[VoteSnapshot]] = defaultdict(list)
     for snapshot in context.vote_history:
         votes_by_day[snapshot.day_count].append(snapshot)
@@ -408,7 +415,7 @@ def build_settlement_recap(context: GameContext) -> SettlementRecapPayload:
         players=[
             SettlementPlayerPayload(
                 seat_id=seat_id,
-                role_code=player.role.value,
+                role_code=ROLE_CODES[player.role],
                 side=role_side(player.role),
                 is_alive=player.is_alive,
                 is_human=isinstance(player, HumanPlayer),
@@ -465,7 +472,7 @@ def build_game_over_message(context: GameContext) -> dict[str, object] | None:
             winning_side=winning_side,
             summary=summary,
             revealed_roles={
-                seat_id: player.role.value
+                seat_id: ROLE_CODES[player.role]
                 for seat_id, player in sorted(context.players.items())
             },
             recap=build_settlement_recap(context),
@@ -943,9 +950,9 @@ async def game_socket(websocket: WebSocket) -> None:
 
     try:
         while True:
-            raw_message = await websocket.receive_json()
+            raw_message = await websocket.receive_text()
             try:
-                envelope = ClientEnvelope.model_validate(raw_message)
+                envelope = ClientEnvelope.model_validate_json(raw_message)
             except ValidationError:
                 logger.warning("invalid websocket payload received")
                 await manager.send_json(websocket, build_system_message("invalid payload"))
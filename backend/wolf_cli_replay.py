@@ -11,7 +11,6 @@ import argparse
 import asyncio
 import random
 import sys
-from datetime import datetime
 
 sys.path.insert(0, __file__.rstrip("wolf_cli_replay.py"))
 
@@ -1,5 +1,5 @@
 from app.domain.enums import Role
-from app.domain.game_context import GameContext, VoteSnapshot
+from app.domain.game_context import ATTACK_WORDS, SUPPORT_WORDS, GameContext, VoteSnapshot
 from app.domain.player import AIPlayer, HumanPlayer, Player
 from app.domain.view_mask import build_player_view
 
@@ -157,3 +157,96 @@ def test_view_mask_reveals_killed_tonight_to_witch_only() -> None:
     view = build_player_view(context, viewer_seat=5)
 
     assert view["killed_tonight"] == [4]
+
+
+def test_game_context_indexes_public_speeches_by_seat() -> None:
+    context = build_context()
+    context.add_public_message("2号发言：我先听后置位。", message_kind="speech", actor_seat=2)
+    context.add_public_message("12号发言：不存在的座位。")
+    context.add_public_message("2号遗言：我是好人。", message_kind="speech", actor_seat=2)
+    context.add_public_message("天亮了。")
+    context.add_public_message("2号发言：4号像狼。", message_kind="speech", actor_seat=2)
+
+    assert context.public_speech_log[2] == ["2号发言：我先听后置位。", "2号发言：4号像狼。"]
+    assert 4 not in context.public_speech_log
+
+
+def test_game_context_indexes_speeches_from_constructor_history() -> None:
+    context = GameContext(public_chat_history=["天亮了。", "3号发言：我是预言家。", "3号遗言：再见。"])
+
+    assert context.public_speech_log == {3: ["3号发言：我是预言家。"]}
+
+
+def test_game_context_keeps_alive_seats_sorted_regardless_of_join_order() -> None:
+    context = GameContext()
+    for seat_id in (5, 2, 9, 1):
+        context.add_player(Player(seat_id=seat_id, role=Role.VILLAGER))
+    context.add_player(Player(seat_id=2, role=Role.WOLF))
+    context.players[9].mark_dead()
+
+    assert context.seat_order == [1, 2, 5, 9]
+    assert context.alive_seat_ids() == [1, 2, 5]
+
+
+def test_game_context_indexes_players_passed_to_constructor() -> None:
+    context = GameContext(
+        players={
+            3: Player(seat_id=3, role=Role.SEER),
+            1: AIPlayer(seat_id=1, role=Role.WOLF, personality="sharp"),
+            2: Player(seat_id=2, role=Role.WOLF),
+        }
+    )
+
+    assert context.alive_seat_ids() == [1, 2, 3]
+    assert context.seats_in_mask(context.role_masks[Role.WOLF]) == [1, 2]
+    view = build_player_view(context, viewer_seat=1)
+    assert [player["known_role"] for player in view["players"]] == ["WOLF", "WOLF", None]
+
+
+def test_game_context_tracks_wolf_seats_as_players_join() -> None:
+    context = build_context()
+
+    assert context.seats_in_mask(context.role_masks[Role.WOLF]) == [2, 3]
+
+    context.add_player(Player(seat_id=3, role=Role.VILLAGER))
+
+    assert context.seats_in_mask(context.role_masks[Role.WOLF]) == [2]
+
+
+def test_game_context_exposes_role_and_alive_bitmasks() -> None:
+    context = build_context()
+    context.players[3].mark_dead()
+
+    assert context.role_masks[Role.WOLF] == (1 << 2) | (1 << 3)
+    assert context.role_masks[Role.SEER] == 1 << 1
+    assert context.alive_mask() == (1 << 1) | (1 << 2) | (1 << 4)
+    assert context.seats_in_mask(context.role_masks[Role.WOLF] & context.alive_mask()) == [2]
+
+    context.add_player(Player(seat_id=3, role=Role.VILLAGER))
+
+    assert context.role_masks[Role.WOLF] == 1 << 2
+    assert context.role_masks[Role.VILLAGER] == (1 << 3) | (1 << 4)
+
+
+def test_game_context_shares_alive_seats_tuple_until_a_death() -> None:
+    context = build_context()
+
+    first = context.alive_seats()
+    assert first == (1, 2, 3, 4)
+    assert context.alive_seats() is first
+
+    context.players[2].mark_dead()
+
+    assert context.alive_seats() == (1, 3, 4)
+    assert context.alive_seat_ids() == [1, 3, 4]
+
+
+def test_stance_words_are_prefix_free_for_single_pass_scan() -> None:
+    words = {*ATTACK_WORDS, *SUPPORT_WORDS}
+
+    assert not [
+        (shorter, longer)
+        for shorter in words
+        for longer in words
+        if shorter != longer and longer.startswith(shorter)
+    ]
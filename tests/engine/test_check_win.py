@@ -52,3 +52,15 @@ def test_game_continues_when_both_camps_still_have_paths() -> None:
     context = build_context(Role.WOLF, Role.VILLAGER, Role.SEER)
 
     assert check_win(context) is None
+
+
+def test_no_winner_for_context_built_from_players_mapping() -> None:
+    context = GameContext(
+        players={
+            1: Player(seat_id=1, role=Role.WOLF),
+            2: Player(seat_id=2, role=Role.VILLAGER),
+            3: Player(seat_id=3, role=Role.SEER),
+        }
+    )
+
+    assert check_win(context) is None
@@ -82,3 +82,13 @@ def test_request_surfaces_schema_validation_errors() -> None:
 
     with pytest.raises(ValidationError):
         client.request_speech(prompt=build_prompt())
+
+
+def test_request_surfaces_schema_errors_from_json_text() -> None:
+    provider = FakeProvider('{"inner_thought":"我要长篇输出。","speech_text":""}')
+    client = JSONModeClient(provider=provider)
+
+    with pytest.raises(ValidationError) as exc_info:
+        client.request_speech(prompt=build_prompt())
+
+    assert not isinstance(exc_info.value, JSONModeError)
@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from app.protocols.s2c import (
     AIThinkingEnvelope,
     AIThinkingPayload,
@@ -320,3 +323,10 @@ def test_game_over_envelope_allows_draw_safety_stop() -> None:
     assert payload["data"]["winning_side"] == "DRAW"
     assert payload["data"]["summary"] == "夜尽未分胜负，本局暂止。"
     assert payload["data"]["recap"] is None
+
+
+def test_server_payloads_are_frozen_once_built() -> None:
+    payload = PhaseChangedPayload(phase="DAY_SPEECH", day_count=1)
+
+    with pytest.raises(ValidationError):
+        payload.day_count = 2
@@ -177,6 +177,26 @@ def test_websocket_logs_invalid_payload_warning(monkeypatch, caplog) -> None:
     assert "invalid websocket payload received" in caplog.text
 
 
+def test_websocket_rejects_malformed_json_as_invalid_payload(monkeypatch) -> None:
+    async def idle_session(*args, **kwargs) -> None:
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr("app.ws.routes.run_game_session", idle_session)
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws/game") as websocket:
+        websocket.receive_json()
+        websocket.receive_json()
+        websocket.receive_json()
+        websocket.receive_json()
+        websocket.receive_json()
+        websocket.send_text("{not json")
+        message = websocket.receive_json()
+
+    assert message["type"] == "SYSTEM_MSG"
+    assert message["data"]["message"] == "invalid payload"
+
+
 def test_websocket_closes_after_game_over(monkeypatch) -> None:
     async def terminal_session(setup_result, send_json, *, close_connection=None, **kwargs) -> None:
         await send_json(
@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 from fastapi import WebSocketDisconnect
 from starlette.websockets import WebSocketState
@@ -20,10 +21,10 @@ class FakeWebSocket:
     async def accept(self) -> None:
         return None
 
-    async def send_json(self, payload: dict[str, object]) -> None:
+    async def send_text(self, data: str) -> None:
         if self.send_error is not None:
             raise self.send_error
-        self.sent_payloads.append(payload)
+        self.sent_payloads.append(json.loads(data))
 
 
 def test_send_json_drops_socket_that_is_no_longer_connected() -> None:
@@ -51,3 +52,21 @@ def test_send_json_drops_socket_after_send_disconnect() -> None:
         assert websocket.sent_payloads == []
 
     asyncio.run(run())
+
+
+def test_send_json_serializes_payload_as_compact_utf8_text() -> None:
+    async def run() -> None:
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+
+        await manager.connect(websocket)
+        await manager.send_json(
+            websocket,
+            {"type": "VOTE_RESOLVED", "data": {"votes": {3: 5}, "summary": "3号出局"}},
+        )
+
+        assert websocket.sent_payloads == [
+            {"type": "VOTE_RESOLVED", "data": {"votes": {"3": 5}, "summary": "3号出局"}},
+        ]
+
+    asyncio.run(run())